@@ -1,10 +1,15 @@
 """CLI interface for radio station database management."""
 
+import itertools
+import random
+import sqlite3
+
 import typer
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional
 from rich.console import Console
-from rich.progress import track
+from rich.progress import Progress
 from rich.table import Table
 from dotenv import load_dotenv
 
@@ -18,6 +23,64 @@ load_dotenv()
 app = typer.Typer(help="Radio Station Database CLI")
 console = Console()
 
+# Batch size for chunked bulk inserts
+_INSERT_CHUNK_SIZE = 5000
+
+# Below this many stations, per-row index maintenance is cheaper than a
+# full drop-and-rebuild of the secondary indexes
+_INDEX_REBUILD_THRESHOLD = 10000
+
+# Flush detected genres to the database every N updates
+_GENRE_FLUSH_SIZE = 500
+
+# Emit buffered per-station log lines every N completions instead of
+# paying a full rich render per station
+_LOG_FLUSH_SIZE = 100
+
+_INSERT_COLUMNS = 12
+
+_ROW_PLACEHOLDER = "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+
+_INSERT_SQL_PREFIX = """
+    INSERT INTO stations (
+        call_sign, facility_id, service_type, frequency,
+        station_name, city, state, latitude, longitude,
+        power_watts, status, data_source
+    ) VALUES """
+
+# Unlike INSERT OR REPLACE (which deletes and re-inserts the row,
+# rewriting every index entry and wiping the genre column), the upsert
+# leaves genre alone and its WHERE clause skips the write entirely when
+# nothing changed, so re-running fetch over an unchanged feed is nearly
+# free
+_UPSERT_SQL_SUFFIX = """
+    ON CONFLICT(call_sign) DO UPDATE SET
+        facility_id = excluded.facility_id,
+        service_type = excluded.service_type,
+        frequency = excluded.frequency,
+        station_name = excluded.station_name,
+        city = excluded.city,
+        state = excluded.state,
+        latitude = excluded.latitude,
+        longitude = excluded.longitude,
+        power_watts = excluded.power_watts,
+        status = excluded.status,
+        data_source = excluded.data_source
+    WHERE stations.facility_id IS NOT excluded.facility_id
+       OR stations.service_type IS NOT excluded.service_type
+       OR stations.frequency IS NOT excluded.frequency
+       OR stations.station_name IS NOT excluded.station_name
+       OR stations.city IS NOT excluded.city
+       OR stations.state IS NOT excluded.state
+       OR stations.latitude IS NOT excluded.latitude
+       OR stations.longitude IS NOT excluded.longitude
+       OR stations.power_watts IS NOT excluded.power_watts
+       OR stations.status IS NOT excluded.status
+       OR stations.data_source IS NOT excluded.data_source
+"""
+
+_INSERT_SQL = _INSERT_SQL_PREFIX + _ROW_PLACEHOLDER + _UPSERT_SQL_SUFFIX
+
 
 @app.command()
 def init(db_path: str = typer.Option("radio_stations.db", help="Database file path")):
@@ -37,6 +100,9 @@ def fetch(
     db_path: str = typer.Option("radio_stations.db", help="Database file path"),
     service: str = typer.Option("both", help="Service type: fm, am, or both"),
     limit: Optional[int] = typer.Option(None, help="Limit number of stations to fetch"),
+    batch_size: int = typer.Option(
+        _INSERT_CHUNK_SIZE, help="Stations per insert batch"
+    ),
 ):
     """Fetch radio station data from FCC and store in database."""
 
@@ -51,31 +117,22 @@ def fetch(
     fetcher = FCCDataFetcher()
 
     try:
-        all_stations = []
-
+        # Chain the per-service generators so stations stream straight from
+        # the FCC feed into the database without building the full list
+        sources = []
         if service in ("fm", "both"):
-            console.print("Fetching FM stations...")
-            fm_stations = fetcher.fetch_fm_stations()
-            if limit and service == "fm":
-                fm_stations = fm_stations[:limit]
-            all_stations.extend(fm_stations)
-
+            sources.append(fetcher.iter_fm_stations())
         if service in ("am", "both"):
-            console.print("Fetching AM stations...")
-            am_stations = fetcher.fetch_am_stations()
-            if limit and service == "am":
-                am_stations = am_stations[:limit]
-            all_stations.extend(am_stations)
+            sources.append(fetcher.iter_am_stations())
 
-        if limit and service == "both":
-            all_stations = all_stations[:limit]
+        stations = itertools.chain.from_iterable(sources)
+        if limit:
+            stations = itertools.islice(stations, limit)
 
-        # Store in database
-        console.print(f"Storing {len(all_stations)} stations in database...")
-        _store_stations(all_stations, db_path)
+        stored = _store_stations(stations, db_path, batch_size=batch_size)
 
         console.print(
-            f"[bold green]✓ Successfully stored {len(all_stations)} stations![/bold green]"
+            f"[bold green]✓ Successfully stored {stored} stations![/bold green]"
         )
 
     except Exception as e:
@@ -92,33 +149,29 @@ def stats(db_path: str = typer.Option("radio_stations.db", help="Database file p
         raise typer.Exit(1)
 
     try:
-        conn = get_connection(db_path)
-
-        # Get counts by service type
-        fm_count = conn.execute(
-            "SELECT COUNT(*) FROM stations WHERE service_type = 'FM'"
-        ).fetchone()[0]
-        am_count = conn.execute(
-            "SELECT COUNT(*) FROM stations WHERE service_type = 'AM'"
-        ).fetchone()[0]
+        conn = get_connection(db_path, readonly=True)
+
+        # Get all scalar counters in one pass over the table instead of
+        # four separate COUNT(*) scans. The whole command runs inside one
+        # implicit read transaction, so only a single shared lock is taken.
+        fm_count, am_count, with_genres, without_genres = conn.execute("""
+            SELECT
+                COALESCE(SUM(service_type = 'FM'), 0),
+                COALESCE(SUM(service_type = 'AM'), 0),
+                COALESCE(SUM(genre IS NOT NULL AND genre != ''), 0),
+                COALESCE(SUM(genre IS NULL OR genre = ''), 0)
+            FROM stations
+        """).fetchone()
         total_count = fm_count + am_count
 
         # Get counts by status
         status_counts = conn.execute("""
-            SELECT status, COUNT(*) 
-            FROM stations 
-            GROUP BY status 
+            SELECT status, COUNT(*)
+            FROM stations
+            GROUP BY status
             ORDER BY COUNT(*) DESC
         """).fetchall()
 
-        # Get genre statistics
-        with_genres = conn.execute(
-            "SELECT COUNT(*) FROM stations WHERE genre IS NOT NULL AND genre != ''"
-        ).fetchone()[0]
-        without_genres = conn.execute(
-            "SELECT COUNT(*) FROM stations WHERE genre IS NULL OR genre = ''"
-        ).fetchone()[0]
-
         # Get top states
         state_counts = conn.execute("""
             SELECT state, COUNT(*) 
@@ -196,6 +249,9 @@ def search(
     ),
     db_path: str = typer.Option("radio_stations.db", help="Database file path"),
     limit: int = typer.Option(10, help="Maximum results to show"),
+    contains: bool = typer.Option(
+        False, help="Match anywhere in the value instead of prefix-only"
+    ),
 ):
     """Search for radio stations."""
 
@@ -204,19 +260,27 @@ def search(
         raise typer.Exit(1)
 
     try:
-        conn = get_connection(db_path)
+        conn = get_connection(db_path, readonly=True)
+
+        # Search across call_sign and city. The default prefix search uses
+        # GLOB, which (unlike the case-insensitive LIKE) can use the
+        # call_sign/city indexes as range probes instead of a full scan.
+        if contains:
+            where = "call_sign LIKE ? OR city LIKE ?"
+            params = (f"%{query}%", f"%{query}%", limit)
+        else:
+            where = "call_sign GLOB ? OR city GLOB ?"
+            params = (f"{query.upper()}*", f"{query}*", limit)
 
-        # Search across call_sign and city
         results = conn.execute(
-            """
+            f"""
             SELECT call_sign, frequency, service_type, city, state, genre
-            FROM stations 
-            WHERE call_sign LIKE ? 
-               OR city LIKE ?
+            FROM stations
+            WHERE {where}
             ORDER BY call_sign
             LIMIT ?
         """,
-            (f"%{query}%", f"%{query}%", limit),
+            params,
         ).fetchall()
 
         conn.close()
@@ -281,15 +345,18 @@ def detect_genres(
             """
             stations_data = conn.execute(query, (call_sign,)).fetchall()
         else:
-            # Process stations without genres
+            # Process stations without genres. ORDER BY RANDOM() would
+            # evaluate RANDOM() for every candidate row and sort them all in
+            # a temp b-tree just to keep `limit`; instead let the partial
+            # missing-genre index drive the scan and shuffle client-side.
             query = """
-                SELECT call_sign, frequency, service_type, city, state 
-                FROM stations 
+                SELECT call_sign, frequency, service_type, city, state
+                FROM stations
                 WHERE genre IS NULL OR genre = ''
-                ORDER BY RANDOM()
                 LIMIT ?
             """
             stations_data = conn.execute(query, (limit,)).fetchall()
+            random.shuffle(stations_data)
 
         if not stations_data:
             console.print(
@@ -314,40 +381,63 @@ def detect_genres(
             for row in stations_data
         ]
 
-        # Process each station
+        # Detections are independent HTTP round-trips, so dispatch them
+        # through a bounded thread pool and drain completions on the main
+        # thread, which stays the only writer to the database
         updated_count = 0
-        for station in track(stations, description="Detecting genres..."):
-            genre = detector.detect_genre(station)
-
-            # Check if quota was exceeded during processing
-            if detector.quota_exceeded:
-                console.print(
-                    "[bold red]🚫 Quota exceeded - stopping processing[/bold red]"
-                )
-                console.print(
-                    f"[yellow]Processed {updated_count} stations before quota limit[/yellow]"
-                )
-                break
-
-            if genre:
-                # Only update database if we got an actual genre (not None)
-                conn.execute(
-                    """
-                    UPDATE stations 
-                    SET genre = ? 
-                    WHERE call_sign = ?
-                """,
-                    (genre, station.call_sign),
-                )
-
-                console.print(f"[green]✓ {station.call_sign}: {genre}[/green]")
-                updated_count += 1
-            else:
-                console.print(
-                    f"[yellow]⚠ {station.call_sign}: No genre detected - database unchanged[/yellow]"
-                )
-
-        conn.commit()
+        pending = []
+        log_lines = []
+        with Progress() as progress:
+            task = progress.add_task("Detecting genres...", total=len(stations))
+
+            with ThreadPoolExecutor(
+                max_workers=min(16, len(stations))
+            ) as executor:
+                futures = {
+                    executor.submit(detector.detect_genre, station): station
+                    for station in stations
+                }
+
+                for future in as_completed(futures):
+                    station = futures[future]
+                    genre = future.result()
+                    progress.update(task, advance=1)
+
+                    # Check if quota was exceeded during processing
+                    if detector.quota_exceeded:
+                        console.print(
+                            "[bold red]🚫 Quota exceeded - stopping processing[/bold red]"
+                        )
+                        console.print(
+                            f"[yellow]Processed {updated_count} stations before quota limit[/yellow]"
+                        )
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        break
+
+                    if genre:
+                        # Only update database if we got an actual genre (not None)
+                        pending.append((genre, station.call_sign))
+                        log_lines.append(f"[green]✓ {station.call_sign}: {genre}[/green]")
+                        updated_count += 1
+
+                        if len(pending) >= _GENRE_FLUSH_SIZE:
+                            _flush_genre_updates(conn, pending)
+                    else:
+                        log_lines.append(
+                            f"[yellow]⚠ {station.call_sign}: No genre detected - database unchanged[/yellow]"
+                        )
+
+                    if len(log_lines) >= _LOG_FLUSH_SIZE:
+                        progress.console.print("\n".join(log_lines))
+                        log_lines.clear()
+
+        # Flush whatever is left (also covers the quota-exceeded break)
+        if log_lines:
+            console.print("\n".join(log_lines))
+        _flush_genre_updates(conn, pending)
+        # Let SQLite refresh whatever statistics the session's queries
+        # showed to be stale (cheap no-op when nothing changed)
+        conn.execute("PRAGMA optimize")
         conn.close()
 
         console.print(
@@ -359,43 +449,149 @@ def detect_genres(
         raise typer.Exit(1)
 
 
-def _store_stations(stations, db_path: str):
-    """Store stations in database."""
+def _flush_genre_updates(conn, pending):
+    """Apply accumulated (genre, call_sign) updates in one batch and commit."""
+    if not pending:
+        return
+    # BEGIN IMMEDIATE takes the write lock up front so a long batch can't
+    # fail with SQLITE_BUSY after doing half its work
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        conn.executemany(
+            "UPDATE stations SET genre = ? WHERE call_sign = ?",
+            pending,
+        )
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    pending.clear()
+
+
+def _store_stations(stations, db_path: str, batch_size: int = _INSERT_CHUNK_SIZE) -> int:
+    """Store an iterable of stations with chunked multi-row inserts in one transaction.
+
+    Accepts any iterable (including generators); returns the number of
+    stations written.
+    """
     conn = get_connection(db_path)
+    # Generators have no len(); the progress bar falls back to
+    # indeterminate mode and the index rebuild is skipped
+    total = len(stations) if hasattr(stations, "__len__") else None
+    stored = 0
 
-    for station in track(stations, description="Storing stations..."):
-        try:
-            conn.execute(
+    try:
+        # Nothing else writes during fetch, so hold the file lock for the
+        # whole bulk load and keep dirty pages in memory instead of
+        # spilling them to the database mid-transaction
+        conn.execute("PRAGMA locking_mode = EXCLUSIVE")
+        conn.execute("PRAGMA cache_spill = OFF")
+
+        # One long-lived cursor so the prepared INSERT survives across
+        # chunks instead of being re-prepared per call
+        cur = conn.cursor()
+
+        # A single INSERT with many VALUES groups is the fastest bulk form
+        # SQLite offers; size it to stay under the host-parameter limit
+        var_limit = conn.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER)
+        rows_per_stmt = max(1, min(500, var_limit // _INSERT_COLUMNS))
+        multi_row_sql = (
+            _INSERT_SQL_PREFIX
+            + ", ".join([_ROW_PLACEHOLDER] * rows_per_stmt)
+            + _UPSERT_SQL_SUFFIX
+        )
+
+        # BEGIN IMMEDIATE takes the write lock before any work happens so
+        # the whole load is one deterministic transaction
+        conn.execute("BEGIN IMMEDIATE")
+
+        # For large loads, drop the secondary indexes up front and rebuild
+        # them once afterwards; rebuilding from a sorted scan is much
+        # cheaper than N incremental b-tree insertions per index
+        index_ddl = []
+        if total is not None and total >= _INDEX_REBUILD_THRESHOLD:
+            index_ddl = conn.execute(
                 """
-                INSERT OR REPLACE INTO stations (
-                    call_sign, facility_id, service_type, frequency,
-                    station_name, city, state, latitude, longitude,
-                    power_watts, status, data_source
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    station.call_sign,
-                    station.facility_id,
-                    station.service_type,
-                    station.frequency,
-                    None,  # station_name not parsed yet
-                    station.city,
-                    station.state,
-                    station.latitude,
-                    station.longitude,
-                    station.power_watts,
-                    station.status,
-                    f"FCC_{station.service_type}",
-                ),
-            )
-        except Exception as e:
-            console.print(
-                f"[yellow]Warning: Failed to store {station.call_sign}: {e}[/yellow]"
-            )
-            continue
+                SELECT name, sql FROM sqlite_master
+                WHERE type = 'index' AND tbl_name = 'stations' AND sql IS NOT NULL
+            """
+            ).fetchall()
+            for name, _ in index_ddl:
+                conn.execute(f"DROP INDEX {name}")
+
+        try:
+            with Progress() as progress:
+                task = progress.add_task("Storing stations...", total=total)
+
+                stations_iter = iter(stations)
+                while True:
+                    chunk = list(itertools.islice(stations_iter, batch_size))
+                    if not chunk:
+                        break
+
+                    # Build the whole parameter array in one comprehension so
+                    # the DML path below is free of per-row Python overhead
+                    rows = [
+                        (
+                            s.call_sign,
+                            s.facility_id,
+                            s.service_type,
+                            s.frequency,
+                            None,  # station_name not parsed yet
+                            s.city,
+                            s.state,
+                            s.latitude,
+                            s.longitude,
+                            s.power_watts,
+                            s.status,
+                            "FCC_" + s.service_type,
+                        )
+                        for s in chunk
+                    ]
+                    for start in range(0, len(rows), rows_per_stmt):
+                        group = rows[start : start + rows_per_stmt]
+                        try:
+                            if len(group) == rows_per_stmt:
+                                cur.execute(
+                                    multi_row_sql,
+                                    list(itertools.chain.from_iterable(group)),
+                                )
+                            else:
+                                # Trailing partial group
+                                cur.executemany(_INSERT_SQL, group)
+                        except sqlite3.IntegrityError:
+                            # Retry the group row by row so one bad station
+                            # doesn't discard its neighbors
+                            for station, row in zip(
+                                chunk[start : start + rows_per_stmt], group
+                            ):
+                                try:
+                                    cur.execute(_INSERT_SQL, row)
+                                except sqlite3.IntegrityError as e:
+                                    console.print(
+                                        f"[yellow]Warning: Failed to store {station.call_sign}: {e}[/yellow]"
+                                    )
+
+                    stored += len(chunk)
+                    progress.update(task, advance=len(chunk))
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        else:
+            # Restore the indexes inside the same transaction, then commit
+            for _, sql in index_ddl:
+                conn.execute(sql)
+            conn.execute("COMMIT")
+
+        conn.execute("PRAGMA locking_mode = NORMAL")
+
+        # Refresh planner statistics so the new row counts steer queries
+        # toward the indexes instead of heuristic full scans
+        conn.execute("ANALYZE")
+    finally:
+        conn.close()
 
-    conn.commit()
-    conn.close()
+    return stored
 
 
 if __name__ == "__main__":
@@ -14,9 +14,34 @@ def init_db(db_path: str = "radio_stations.db") -> None:
     conn.close()
 
 
-def get_connection(db_path: str = "radio_stations.db") -> sqlite3.Connection:
-    """Get database connection with proper configuration."""
-    conn = sqlite3.connect(db_path, autocommit=False)
+def get_connection(
+    db_path: str = "radio_stations.db", readonly: bool = False
+) -> sqlite3.Connection:
+    """Get database connection with proper configuration.
+
+    Read-only callers (stats, search) can pass readonly=True to open the
+    file with mode=ro and avoid taking any write lock.
+
+    The connection runs in autocommit (isolation_level=None); writers are
+    expected to bracket multi-statement work with explicit
+    BEGIN IMMEDIATE / COMMIT so transaction boundaries are deterministic
+    rather than driven by the sqlite3 module's implicit BEGINs.
+    """
+    if readonly:
+        conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True, isolation_level=None)
+    else:
+        conn = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False)
     conn.row_factory = sqlite3.Row
+
+    # WAL persists in the database file, so setting it every open is a
+    # no-op after the first time. With WAL, synchronous=NORMAL is safe
+    # (no data loss on application crash) and drops one fsync per commit;
+    # readers also no longer block on the writer.
+    if not readonly:
+        conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA cache_size = -65536")  # 64 MiB page cache
+    conn.execute("PRAGMA mmap_size = 268435456")  # 256 MiB
     conn.execute("PRAGMA foreign_keys = ON")
     return conn
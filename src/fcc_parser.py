@@ -1,54 +1,103 @@
 """Parser for FCC pipe-delimited radio station data."""
 
+import io
+import logging
+import os
 import requests
 import re
-from pydantic import BaseModel, Field, field_validator
-from typing import List, Optional, Tuple
-
-
-class RadioStation(BaseModel):
-    """Radio station data structure with validation."""
-
-    call_sign: str = Field(..., description="Station call sign")
-    frequency: float = Field(..., gt=0, description="Frequency in MHz")
-    service_type: str = Field(..., pattern="^(FM|AM)$", description="Service type")
-    city: str = Field(..., description="City of license")
-    state: str = Field(..., max_length=2, description="State abbreviation")
-    latitude: Optional[float] = Field(
-        None, ge=-90, le=90, description="Latitude in degrees"
-    )
-    longitude: Optional[float] = Field(
-        None, ge=-180, le=180, description="Longitude in degrees"
-    )
-    power_watts: Optional[float] = Field(None, ge=0, description="Power in watts")
-    licensee: Optional[str] = Field(None, description="License holder")
-    facility_id: Optional[str] = Field(None, description="FCC facility ID")
-    status: Optional[str] = Field(None, description="License status")
-
-    @field_validator("frequency")
-    @classmethod
-    def validate_frequency(cls, v, info):
-        """Validate frequency ranges for FM/AM."""
-        # Note: service_type validation happens after frequency in Pydantic v2
-        # We'll do a basic range check here
-        if not (0.53 <= v <= 107.9):
-            raise ValueError("Frequency must be between 0.53 and 107.9 MHz")
-        return v
-
-    @field_validator("call_sign")
-    @classmethod
-    def validate_call_sign(cls, v):
-        """Validate call sign format - preserve FCC data as presented."""
-        if not v:
-            raise ValueError("Call sign cannot be empty")
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter, Retry
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Tuple
+
+try:
+    import pandas as pd
+except ImportError:
+    # pandas is an optional fast path; the per-line parser below still works
+    pd = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    # pyarrow is a further optional speedup for the columnar number
+    # extraction; pandas' str.extract is the fallback
+    pa = None
+
+
+@dataclass(slots=True, frozen=True)
+class RadioStation:
+    """Radio station data structure.
+
+    A __slots__ dataclass rather than a Pydantic model: tens of thousands
+    of stations are built and held in memory per refresh, and slotted
+    instances skip the per-instance __dict__ and model machinery on both
+    construction and attribute access. validate() carries the checks the
+    old model's field constraints enforced.
+    """
+
+    call_sign: str
+    frequency: float  # MHz
+    service_type: str  # "FM" or "AM"
+    city: str
+    state: str
+    latitude: Optional[float] = None  # degrees
+    longitude: Optional[float] = None  # degrees
+    power_watts: Optional[float] = None
+    licensee: Optional[str] = None
+    facility_id: Optional[str] = None
+    status: Optional[str] = None
+
+    def validate(self) -> "RadioStation":
+        """Check the invariants the parser normally guarantees itself."""
         # Allow "-" as it appears to be FCC placeholder for vacant allocations
-        return v.strip()
+        if not self.call_sign:
+            raise ValueError("Call sign cannot be empty")
+        if self.service_type not in ("FM", "AM"):
+            raise ValueError(f"Invalid service type: {self.service_type!r}")
+        if not 0.53 <= self.frequency <= 107.9:
+            raise ValueError("Frequency must be between 0.53 and 107.9 MHz")
+        if len(self.state) > 2:
+            raise ValueError(f"Invalid state abbreviation: {self.state!r}")
+        if self.latitude is not None and not -90 <= self.latitude <= 90:
+            raise ValueError(f"Latitude out of range: {self.latitude}")
+        if self.longitude is not None and not -180 <= self.longitude <= 180:
+            raise ValueError(f"Longitude out of range: {self.longitude}")
+        if self.power_watts is not None and self.power_watts < 0:
+            raise ValueError(f"Power cannot be negative: {self.power_watts}")
+        return self
+
+
+# Compiled once; FCC numeric fields ("88.1  MHz", "2.5    kW") start with
+# the number, so an anchored match avoids re.search's scan loop
+_NUM_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)")
+
+# Named-group variant for pyarrow's extract_regex (RE2 requires the
+# capture group to be named)
+_NUM_RE_NAMED = r"^\s*(?P<n>\d+(?:\.\d+)?)"
+
+
+def _extract_number(series):
+    """Pull the leading number out of a string column as a float Series.
+
+    With pyarrow installed this runs extract_regex, a single RE2-backed
+    C++ kernel over the whole column; otherwise it falls back to pandas'
+    per-row str.extract with the compiled pattern.
+    """
+    if pa is not None:
+        matched = pc.extract_regex(
+            pa.array(series, type=pa.string()), pattern=_NUM_RE_NAMED
+        )
+        extracted = pc.struct_field(matched, "n").to_pandas()
+        return pd.to_numeric(extracted, errors="coerce").set_axis(series.index)
+    return pd.to_numeric(series.str.extract(_NUM_RE, expand=False), errors="coerce")
 
-    class Config:
-        """Pydantic configuration."""
 
-        str_strip_whitespace = True
-        validate_assignment = True
+# Per-row diagnostics go through logging with lazy %s args, so when the
+# level is above DEBUG a payload full of malformed rows costs nothing
+# (no f-string built, no stdout lock taken per row)
+log = logging.getLogger(__name__)
 
 
 class FCCDataFetcher:
@@ -102,89 +151,291 @@ class FCCDataFetcher:
         # licensee is typically in a longer field around position 27-35
     }
 
-    def fetch_fm_stations(self) -> List[RadioStation]:
-        """Fetch and parse FM station data."""
-        print("Fetching FM station data...")
-        response = requests.get(self.FM_URL, timeout=120)
-        response.raise_for_status()
-
-        stations = []
-        lines = response.text.strip().split("\n")
-        print(f"Processing {len(lines)} FM stations...")
+    # Field indices unpacked once per row instead of going through
+    # _get_field's dict lookup + bounds check eight times per line.
+    # The minimum-length check above guarantees the indices are in range.
+    _SCALAR_KEYS = ("call_sign", "frequency", "status", "city", "state", "facility_id", "power")
+    _COORD_KEYS = (
+        "lat_degrees",
+        "lat_minutes",
+        "lat_seconds",
+        "lon_degrees",
+        "lon_minutes",
+        "lon_seconds",
+    )
+    # map() instead of a genexp: class-body comprehensions can't see
+    # other class-level names
+    _FM_IDX = tuple(map(FM_FIELDS.get, _SCALAR_KEYS))
+    _AM_IDX = tuple(map(AM_FIELDS.get, _SCALAR_KEYS))
+    _FM_COORD_IDX = tuple(map(FM_FIELDS.get, _COORD_KEYS))
+    _AM_COORD_IDX = tuple(map(AM_FIELDS.get, _COORD_KEYS))
+
+    # Minimum field counts and the licensee search window, computed once
+    # instead of re-running max() over the dict on every row
+    _FM_MIN_FIELDS = max(FM_FIELDS.values()) + 1
+    _AM_MIN_FIELDS = max(AM_FIELDS.values()) + 1
+    _LICENSEE_SLICE = slice(25, 35)
+
+    def __init__(self, strict_mode: bool = False):
+        """Create a fetcher.
+
+        The parser already enforces the model's invariants (service_type is
+        a literal, frequency was just parsed, coordinates are bounded by the
+        US-territory check), so by default stations are built without
+        re-validation. Pass strict_mode=True to run RadioStation.validate()
+        on every row.
+        """
+        self.strict_mode = strict_mode
+
+        # ~60 distinct states and a handful of big station groups repeat
+        # across tens of thousands of rows; sharing one str object per
+        # distinct value trims RSS by the duplicate factor
+        self._licensee_cache: dict = {}
+
+        # One Session for both feeds: the AM fetch reuses the FM fetch's
+        # TCP+TLS connection, gzip shrinks the text payload on the wire,
+        # and transient 5xx get retried instead of killing a full refresh
+        self._session = requests.Session()
+        self._session.headers.update(
+            {
+                "Accept-Encoding": "gzip, deflate",
+                "User-Agent": "radio-station-db/1.0",
+            }
+        )
+        self._session.mount(
+            "https://",
+            HTTPAdapter(
+                max_retries=Retry(
+                    total=2,
+                    backoff_factor=0.3,
+                    status_forcelist=(500, 502, 503, 504),
+                )
+            ),
+        )
 
-        for line_num, line in enumerate(lines, 1):
-            try:
-                station = self._parse_fm_line(line)
+    def _build_station(self, **data) -> RadioStation:
+        """Build a RadioStation, validating only in strict mode."""
+        # Intern the low-cardinality columns and dedup licensee strings
+        # so identical values share one object across all stations
+        data["state"] = sys.intern(data["state"])
+        data["service_type"] = sys.intern(data["service_type"])
+        licensee = data.get("licensee")
+        if licensee:
+            data["licensee"] = self._licensee_cache.setdefault(licensee, licensee)
+        station = RadioStation(**data)
+        if self.strict_mode:
+            station.validate()
+        return station
+
+    def iter_fm_stations(self) -> Iterator[RadioStation]:
+        """Stream parsed FM stations without materializing the full list."""
+        log.info("Fetching FM station data...")
+        with self._session.get(self.FM_URL, stream=True, timeout=120) as response:
+            response.raise_for_status()
+
+            if pd is not None:
+                # read_csv consumes the socket directly, so the C delimiter
+                # scan overlaps with the network transfer
+                response.raw.decode_content = True
+                yield from self._iter_stations_vectorized(response.raw, "FM")
+                return
+
+            for line_num, line in enumerate(
+                response.iter_lines(decode_unicode=True, chunk_size=65536), 1
+            ):
+                if not line:
+                    continue
+                try:
+                    station = self._parse_fm_line(line)
+                except Exception as e:
+                    log.debug("Error parsing FM line %d: %s", line_num, e)
+                    continue
                 if station:
-                    stations.append(station)
-            except Exception as e:
-                print(f"Error parsing FM line {line_num}: {e}")
-                continue
+                    yield station
 
-        print(f"Successfully parsed {len(stations)} FM stations")
+    def fetch_fm_stations(self) -> List[RadioStation]:
+        """Fetch and parse FM station data."""
+        stations = list(self.iter_fm_stations())
+        log.info("Successfully parsed %d FM stations", len(stations))
         return stations
 
+    def iter_am_stations(self) -> Iterator[RadioStation]:
+        """Stream parsed AM stations without materializing the full list."""
+        log.info("Fetching AM station data...")
+        with self._session.get(self.AM_URL, stream=True, timeout=120) as response:
+            response.raise_for_status()
+
+            if pd is not None:
+                response.raw.decode_content = True
+                yield from self._iter_stations_vectorized(response.raw, "AM")
+                return
+
+            for line_num, line in enumerate(
+                response.iter_lines(decode_unicode=True, chunk_size=65536), 1
+            ):
+                if not line:
+                    continue
+                try:
+                    station = self._parse_am_line(line)
+                except Exception as e:
+                    log.debug("Error parsing AM line %d: %s", line_num, e)
+                    continue
+                if station:
+                    yield station
+
     def fetch_am_stations(self) -> List[RadioStation]:
         """Fetch and parse AM station data."""
-        print("Fetching AM station data...")
-        response = requests.get(self.AM_URL, timeout=120)
-        response.raise_for_status()
-
-        stations = []
-        lines = response.text.strip().split("\n")
-        print(f"Processing {len(lines)} AM stations...")
+        stations = list(self.iter_am_stations())
+        log.info("Successfully parsed %d AM stations", len(stations))
+        return stations
 
-        for line_num, line in enumerate(lines, 1):
-            try:
-                station = self._parse_am_line(line)
-                if station:
-                    stations.append(station)
-            except Exception as e:
-                print(f"Error parsing AM line {line_num}: {e}")
-                continue
+    def fetch_all(self) -> Tuple[List[RadioStation], List[RadioStation]]:
+        """Fetch FM and AM station data concurrently.
+
+        The two downloads are independent and I/O-bound, so overlapping
+        them roughly halves the wall time of a full refresh.
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            fm_future = executor.submit(self.fetch_fm_stations)
+            am_future = executor.submit(self.fetch_am_stations)
+            return fm_future.result(), am_future.result()
+
+    def _iter_stations_vectorized(self, source, service_type: str) -> Iterator[RadioStation]:
+        """Parse a whole FCC payload through pandas and yield stations."""
+        df = self._parse_dataframe(source, service_type)
+        log.info("Processing %d %s stations...", len(df), service_type)
+        for record in df.to_dict("records"):
+            yield self._build_station(**record)
+
+    def _parse_dataframe(self, source, service_type: str):
+        """Parse an FCC pipe-delimited payload into a DataFrame.
+
+        Accepts the payload as a string or a file-like object (e.g. the
+        raw HTTP response stream). One read_csv call does the delimiter
+        scan in C, and the field coercions run as column-wise operations
+        instead of per-row Python.
+        """
+        field_map = self.FM_FIELDS if service_type == "FM" else self.AM_FIELDS
+        # Licensee is the first long field somewhere after the coordinates
+        # (same window the scalar _find_licensee_field scans)
+        licensee_cols = list(range(27, 35))
+        usecols = sorted(set(field_map.values()) | set(licensee_cols))
+
+        if isinstance(source, str):
+            source = io.StringIO(source)
+
+        df = pd.read_csv(
+            source,
+            sep="|",
+            header=None,
+            usecols=usecols,
+            dtype=str,
+            engine="c",
+            na_filter=False,
+            on_bad_lines="skip",
+            encoding="latin-1",
+        )
+        df = df.fillna("")
+        df = df.rename(columns={index: name for name, index in field_map.items()})
+
+        for name in field_map:
+            df[name] = df[name].str.strip()
+
+        df = df[df["call_sign"] != ""]
+
+        # Frequency: "88.1  MHz" / "540   kHz" -> MHz
+        freq = _extract_number(df["frequency"])
+        is_khz = df["frequency"].str.contains("kHz") | (freq < 30)
+        df["frequency"] = freq.where(~is_khz, freq / 1000.0)
+        df = df[df["frequency"].notna() & (df["frequency"] > 0)]
+
+        # Power: "2.5    kW" -> watts
+        df["power_watts"] = _extract_number(df["power"]) * 1000
+
+        # Coordinates: DMS columns -> decimal degrees as whole-column
+        # arithmetic (one NumPy kernel per term instead of a Python
+        # closure per row), with the same US-territory bounds check as
+        # the scalar path
+        def _coord_col(name):
+            return pd.to_numeric(df[name], errors="coerce").fillna(0)
+
+        lat = (
+            _coord_col("lat_degrees")
+            + _coord_col("lat_minutes") / 60.0
+            + _coord_col("lat_seconds") / 3600.0
+        )
+        lon = -(
+            _coord_col("lon_degrees")
+            + _coord_col("lon_minutes") / 60.0
+            + _coord_col("lon_seconds") / 3600.0
+        )
+        in_bounds = (lat >= 18) & (lat <= 72) & (lon >= -180) & (lon <= -60)
+        lat = lat.where(in_bounds)
+        lon = lon.where(in_bounds)
+
+        df["licensee"] = df[licensee_cols].apply(
+            lambda row: next(
+                (s.strip() for s in row if isinstance(s, str) and len(s.strip()) > 10),
+                "",
+            ),
+            axis=1,
+        )
 
-        print(f"Successfully parsed {len(stations)} AM stations")
-        return stations
+        out = df[
+            [
+                "call_sign",
+                "frequency",
+                "city",
+                "state",
+                "power_watts",
+                "licensee",
+                "facility_id",
+                "status",
+            ]
+        ].copy()
+        out["service_type"] = service_type
+        out["latitude"] = lat
+        out["longitude"] = lon
+
+        # NaN -> None so optional model fields stay None like the scalar path
+        return out.astype(object).where(out.notna(), None)
 
     def _parse_fm_line(self, line: str) -> Optional[RadioStation]:
         """Parse a single FM station line using field mappings."""
         fields = line.split("|")
-        if len(fields) < max(self.FM_FIELDS.values()):  # Need minimum fields
+        if len(fields) < self._FM_MIN_FIELDS:  # Need minimum fields
             return None
 
+        ci, fi, si, cti, sti, fai, pi = self._FM_IDX
         try:
-            # Extract key fields using field mappings
-            call_sign = self._get_field(fields, self.FM_FIELDS, "call_sign")
+            call_sign = fields[ci].strip()
             if not call_sign:
                 return None
 
             # Parse frequency (e.g., "88.1  MHz")
-            freq_str = self._get_field(fields, self.FM_FIELDS, "frequency")
-            frequency = self._parse_frequency(freq_str)
+            frequency = self._parse_frequency(fields[fi].strip())
             if not frequency:
                 return None
 
-            city = self._get_field(fields, self.FM_FIELDS, "city")
-            state = self._get_field(fields, self.FM_FIELDS, "state")
+            city = fields[cti].strip()
+            state = fields[sti].strip()
 
-            # Parse coordinates using field mappings
-            lat, lon = self._parse_coordinates(fields, self.FM_FIELDS)
+            lat, lon = self._parse_coordinates(fields, self._FM_COORD_IDX)
 
             # Parse power (kW to watts)
-            power_str = self._get_field(fields, self.FM_FIELDS, "power")
-            power_watts = self._parse_power(power_str)
+            power_watts = self._parse_power(fields[pi].strip())
 
             # Find licensee field (longer field in later positions)
             licensee = self._find_licensee_field(fields)
 
-            facility_id = self._get_field(fields, self.FM_FIELDS, "facility_id")
-            status = self._get_field(fields, self.FM_FIELDS, "status")
+            facility_id = fields[fai].strip()
+            status = fields[si].strip()
 
         except Exception as e:
-            print(f"Error parsing FM fields: {e}")
+            log.debug("Error parsing FM fields: %s", e)
             return None
 
-        return RadioStation(
+        return self._build_station(
             call_sign=call_sign,
             frequency=frequency,
             service_type="FM",
@@ -201,42 +452,39 @@ class FCCDataFetcher:
     def _parse_am_line(self, line: str) -> Optional[RadioStation]:
         """Parse a single AM station line using field mappings."""
         fields = line.split("|")
-        if len(fields) < max(self.AM_FIELDS.values()):  # Need minimum fields
+        if len(fields) < self._AM_MIN_FIELDS:  # Need minimum fields
             return None
 
+        ci, fi, si, cti, sti, fai, pi = self._AM_IDX
         try:
-            # Extract key fields using field mappings
-            call_sign = self._get_field(fields, self.AM_FIELDS, "call_sign")
+            call_sign = fields[ci].strip()
             if not call_sign:
                 return None
 
             # Parse frequency (e.g., "540   kHz")
-            freq_str = self._get_field(fields, self.AM_FIELDS, "frequency")
-            frequency = self._parse_frequency(freq_str)
+            frequency = self._parse_frequency(fields[fi].strip())
             if not frequency:
                 return None
 
-            city = self._get_field(fields, self.AM_FIELDS, "city")
-            state = self._get_field(fields, self.AM_FIELDS, "state")
+            city = fields[cti].strip()
+            state = fields[sti].strip()
 
-            # Parse coordinates using field mappings
-            lat, lon = self._parse_coordinates(fields, self.AM_FIELDS)
+            lat, lon = self._parse_coordinates(fields, self._AM_COORD_IDX)
 
             # Parse power (kW to watts)
-            power_str = self._get_field(fields, self.AM_FIELDS, "power")
-            power_watts = self._parse_power(power_str)
+            power_watts = self._parse_power(fields[pi].strip())
 
             # Find licensee field (longer field in later positions)
             licensee = self._find_licensee_field(fields)
 
-            facility_id = self._get_field(fields, self.AM_FIELDS, "facility_id")
-            status = self._get_field(fields, self.AM_FIELDS, "status")
+            facility_id = fields[fai].strip()
+            status = fields[si].strip()
 
         except Exception as e:
-            print(f"Error parsing AM fields: {e}")
+            log.debug("Error parsing AM fields: %s", e)
             return None
 
-        return RadioStation(
+        return self._build_station(
             call_sign=call_sign,
             frequency=frequency,
             service_type="AM",
@@ -256,14 +504,15 @@ class FCCDataFetcher:
             return None
 
         # Extract number from string like "88.1  MHz" or "540   kHz"
-        match = re.search(r"(\d+(?:\.\d+)?)", freq_str)
+        match = _NUM_RE.match(freq_str)
         if not match:
             return None
 
         freq = float(match.group(1))
 
-        # Convert kHz to MHz for AM stations
-        if "kHz" in freq_str or freq < 30:  # AM frequencies are in kHz or < 30 MHz
+        # Convert kHz to MHz for AM stations (the cheap numeric check
+        # short-circuits the substring scan for kHz values)
+        if freq < 30 or "kHz" in freq_str:  # AM frequencies are in kHz or < 30 MHz
             freq = freq / 1000.0  # Convert kHz to MHz
 
         return freq
@@ -274,71 +523,84 @@ class FCCDataFetcher:
             return None
 
         # Extract number from string like "2.5    kW"
-        match = re.search(r"(\d+(?:\.\d+)?)", power_str)
+        match = _NUM_RE.match(power_str)
         if not match:
             return None
 
         power_kw = float(match.group(1))
         return power_kw * 1000  # Convert kW to watts
 
-    def _get_field(self, fields: List[str], field_map: dict, field_name: str) -> str:
-        """Safely get a field from the fields list using the field mapping."""
-        field_index = field_map.get(field_name)
-        if field_index is None or field_index >= len(fields):
-            return ""
-        return fields[field_index].strip()
-
     def _find_licensee_field(self, fields: List[str]) -> str:
         """Find the licensee field (typically a longer field in later positions)."""
-        for i in range(25, min(len(fields), 35)):
-            field_content = fields[i].strip()
-            if field_content and len(field_content) > 10:
-                return field_content
-        return ""
+        stripped = [f.strip() for f in fields[self._LICENSEE_SLICE]]
+        return next((s for s in stripped if len(s) > 10), "")
+
+    @staticmethod
+    def _to_int(s: str) -> int:
+        """Parse a DMS component, treating junk like '-' as zero.
+
+        The isdigit check sidesteps raising/catching ValueError on the
+        malformed rows the FCC payload is known to contain; building an
+        exception is an order of magnitude slower than the branch.
+        """
+        return int(s) if s.isdigit() else 0
+
+    @staticmethod
+    def _to_float(s: str) -> float:
+        """Parse a decimal seconds component, treating junk as zero."""
+        try:
+            return float(s)
+        except ValueError:
+            return 0.0
+
+    @staticmethod
+    def _dms_to_decimal(
+        lat_deg: int,
+        lat_min: int,
+        lat_sec: float,
+        lon_deg: int,
+        lon_min: int,
+        lon_sec: float,
+    ) -> Tuple[Optional[float], Optional[float]]:
+        """Convert DMS components to decimal degrees.
+
+        Pure numeric core, separated from the string handling so it can
+        be JIT-compiled as-is should a native-code path (e.g. numba)
+        ever be worthwhile; the columnar pandas path already runs the
+        same arithmetic vectorized.
+        """
+        lat = lat_deg + lat_min / 60 + lat_sec / 3600
+        lon = -(lon_deg + lon_min / 60 + lon_sec / 3600)  # West is negative
+
+        # Validate reasonable coordinates (US territory)
+        if lat < 18 or lat > 72 or lon < -180 or lon > -60:
+            return None, None
+
+        return lat, lon
 
     def _parse_coordinates(
-        self, fields: List[str], field_map: dict
+        self, fields: List[str], coord_idx: Tuple[int, ...]
     ) -> Tuple[Optional[float], Optional[float]]:
-        """Parse coordinates using field mappings."""
-        try:
-            # Get coordinate components using field mappings
-            lat_deg_str = self._get_field(fields, field_map, "lat_degrees")
-            lat_min_str = self._get_field(fields, field_map, "lat_minutes")
-            lat_sec_str = self._get_field(fields, field_map, "lat_seconds")
-
-            lon_deg_str = self._get_field(fields, field_map, "lon_degrees")
-            lon_min_str = self._get_field(fields, field_map, "lon_minutes")
-            lon_sec_str = self._get_field(fields, field_map, "lon_seconds")
-
-            # Parse to numbers
-            lat_deg = int(lat_deg_str) if lat_deg_str else 0
-            lat_min = int(lat_min_str) if lat_min_str else 0
-            lat_sec = float(lat_sec_str) if lat_sec_str else 0
-
-            lon_deg = int(lon_deg_str) if lon_deg_str else 0
-            lon_min = int(lon_min_str) if lon_min_str else 0
-            lon_sec = float(lon_sec_str) if lon_sec_str else 0
-
-            # Convert to decimal degrees
-            lat = lat_deg + lat_min / 60 + lat_sec / 3600
-            lon = -(lon_deg + lon_min / 60 + lon_sec / 3600)  # West is negative
-
-            # Validate reasonable coordinates (US territory)
-            if lat < 18 or lat > 72 or lon < -180 or lon > -60:
-                return None, None
-
-            return lat, lon
-        except (ValueError, IndexError):
-            return None, None
+        """Parse coordinates from the six precomputed DMS field indices."""
+        return self._dms_to_decimal(
+            self._to_int(fields[coord_idx[0]].strip()),
+            self._to_int(fields[coord_idx[1]].strip()),
+            self._to_float(fields[coord_idx[2]].strip()),
+            self._to_int(fields[coord_idx[3]].strip()),
+            self._to_int(fields[coord_idx[4]].strip()),
+            self._to_float(fields[coord_idx[5]].strip()),
+        )
 
 
 def main():
     """Test the parser with sample data."""
+    # LOG_LEVEL=DEBUG surfaces the per-row parse diagnostics
+    logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"))
     fetcher = FCCDataFetcher()
 
-    # Fetch a few FM stations to test
-    print("Testing FM parser...")
-    fm_stations = fetcher.fetch_fm_stations()
+    # Fetch both feeds in parallel
+    print("Testing FM and AM parsers...")
+    fm_stations, am_stations = fetcher.fetch_all()
 
     if fm_stations:
         print("\nFirst 3 FM stations:")
@@ -347,10 +609,6 @@ def main():
                 f"  {station.call_sign} - {station.frequency} MHz - {station.city}, {station.state}"
             )
 
-    # Fetch a few AM stations to test
-    print("\nTesting AM parser...")
-    am_stations = fetcher.fetch_am_stations()
-
     if am_stations:
         print("\nFirst 3 AM stations:")
         for station in am_stations[:3]:
@@ -1,11 +1,32 @@
 """Genre detection module using Gemini with Google Search grounding."""
 
+import logging
 import os
+import re
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional, List
 from google import genai
 from google.genai import types
 from dataclasses import dataclass
 
+# Per-station chatter is level-gated; the lazy %s args mean nothing is
+# formatted (and no stdout lock is taken) unless the level is enabled
+log = logging.getLogger(__name__)
+
+# Compiled once for _extract_genre: one case-insensitive pass replaces
+# the per-prefix startswith loop that lowercased the whole response on
+# every iteration
+_PREFIX_RE = re.compile(
+    r"^(?:the genre is|the format is|this station plays|primary genre:|format:|genre:)\s*",
+    re.IGNORECASE,
+)
+_UNKNOWN_RE = re.compile(
+    r"unknown|unclear|cannot determine|not found", re.IGNORECASE
+)
+
 
 @dataclass
 class StationInfo:
@@ -18,11 +39,39 @@ class StationInfo:
     state: str
 
 
+class _RateLimiter:
+    """Spaces requests out so worker threads stay under a per-minute quota."""
+
+    def __init__(self, max_per_minute: int):
+        self._interval = 60.0 / max_per_minute
+        self._lock = threading.Lock()
+        self._next_time = 0.0
+
+    def acquire(self):
+        """Block until the caller may issue its request."""
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_time - now
+            self._next_time = max(now, self._next_time) + self._interval
+        if wait > 0:
+            time.sleep(wait)
+
+
 class GenreDetector:
     """Detects radio station genres using Gemini with Google Search grounding."""
 
-    def __init__(self):
-        """Initialize the genre detector with Gemini client."""
+    def __init__(
+        self,
+        max_requests_per_minute: int = 60,
+        cache_path: str = "genre_cache.sqlite",
+        max_age_days: int = 180,
+    ):
+        """Initialize the genre detector with Gemini client.
+
+        Detected genres are cached on disk keyed by station identity, so
+        re-runs skip the API (and the daily grounding quota) for stations
+        resolved within the last max_age_days.
+        """
         api_key = os.getenv("GEMINI_API_KEY")
         if not api_key:
             raise ValueError("GEMINI_API_KEY environment variable not set")
@@ -33,8 +82,48 @@ class GenreDetector:
         # Define the grounding tool
         self.grounding_tool = types.Tool(google_search=types.GoogleSearch())
 
-        # Track quota status for the API key
+        # Track quota status for the API key; the lock keeps the flag
+        # coherent when detections run on multiple threads
         self.quota_exceeded = False
+        self._quota_lock = threading.Lock()
+
+        # Shared limiter so parallel workers respect the provider quota
+        self._rate_limiter = _RateLimiter(max_requests_per_minute)
+
+        # Persistent detection cache; station genres change rarely
+        self._cache = sqlite3.connect(cache_path, check_same_thread=False)
+        self._cache.execute(
+            "CREATE TABLE IF NOT EXISTS kv (k TEXT PRIMARY KEY, v TEXT, ts INTEGER)"
+        )
+        self._cache.commit()
+        self._cache_lock = threading.Lock()
+        self._max_age_seconds = max_age_days * 86400
+
+    def _cache_get(self, key: str) -> Optional[str]:
+        """Return the cached genre for a key, or None if absent/stale."""
+        with self._cache_lock:
+            row = self._cache.execute(
+                "SELECT v, ts FROM kv WHERE k = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        value, ts = row
+        if time.time() - ts > self._max_age_seconds:
+            return None
+        return value
+
+    def _cache_put(self, key: str, value: str) -> None:
+        """Store a detected genre in the persistent cache."""
+        with self._cache_lock:
+            self._cache.execute(
+                "INSERT OR REPLACE INTO kv (k, v, ts) VALUES (?, ?, ?)",
+                (key, value, int(time.time())),
+            )
+            self._cache.commit()
+
+    @staticmethod
+    def _cache_key(station: "StationInfo") -> str:
+        return f"{station.call_sign}|{station.frequency:.2f}|{station.city}|{station.state}"
 
     def detect_genre(self, station: StationInfo, max_retries: int = 3) -> Optional[str]:
         """
@@ -47,16 +136,24 @@ class GenreDetector:
         Returns:
             Detected genre as a string, or None if detection fails
         """
+        # A cache hit costs nothing and works even after the quota is gone
+        cache_key = self._cache_key(station)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
         # Check if quota is already exceeded for this API key
-        if self.quota_exceeded:
-            # Don't process any more stations - quota exceeded
-            return None
+        with self._quota_lock:
+            if self.quota_exceeded:
+                # Don't process any more stations - quota exceeded
+                return None
 
         # Create a comprehensive search query
         query = self._build_genre_query(station)
 
         for attempt in range(max_retries):
             try:
+                self._rate_limiter.acquire()
                 response = self.client.models.generate_content(
                     model="gemini-2.5-flash",
                     contents=query,
@@ -68,15 +165,19 @@ class GenreDetector:
 
                 # Check if response is properly grounded
                 if not self._has_grounding_metadata(response):
-                    print(
-                        f"Attempt {attempt + 1}: No grounding metadata for {station.call_sign}, retrying..."
+                    log.debug(
+                        "Attempt %d: No grounding metadata for %s, retrying...",
+                        attempt + 1,
+                        station.call_sign,
                     )
                     continue
 
                 # Extract and clean the genre from response
                 if response.text:
                     genre = self._extract_genre(response.text)
-                    print(f"✓ {station.call_sign}: Successfully grounded response")
+                    log.info("%s: Successfully grounded response", station.call_sign)
+                    if genre:
+                        self._cache_put(cache_key, genre)
                     return genre
                 return None
 
@@ -84,39 +185,129 @@ class GenreDetector:
                 # Check if it's a quota/rate limit error
                 error_msg = str(e).lower()
                 if "quota" in error_msg or "exhausted" in error_msg or "429" in str(e):
-                    print(f"🚫 Google Search Grounding quota exceeded for API key: {e}")
-                    print(
-                        "Daily limit of 500 grounding requests reached. Quota resets at midnight Pacific time."
-                    )
-                    print("All subsequent requests will be skipped until quota resets.")
-                    self.quota_exceeded = (
-                        True  # Mark quota as exceeded for this session
+                    log.warning(
+                        "Google Search Grounding quota exceeded for API key: %s. "
+                        "Daily limit of 500 grounding requests reached; quota resets "
+                        "at midnight Pacific time. All subsequent requests will be "
+                        "skipped until quota resets.",
+                        e,
                     )
+                    # Mark quota as exceeded for this session
+                    with self._quota_lock:
+                        self.quota_exceeded = True
                     return None  # DO NOT write status to database - leave genre field empty
-                print(f"Error detecting genre for {station.call_sign}: {e}")
+                log.warning("Error detecting genre for %s: %s", station.call_sign, e)
                 return None
 
-        print(
-            f"⚠ {station.call_sign}: Failed to get grounded response after {max_retries} attempts"
+        log.warning(
+            "%s: Failed to get grounded response after %d attempts",
+            station.call_sign,
+            max_retries,
         )
         return None
 
+    # Batch-mode tuning: requests per batch job and poll cadence
+    _BATCH_SIZE = 50
+    _BATCH_POLL_SECONDS = 10.0
+    _BATCH_TERMINAL_STATES = frozenset(
+        {
+            "JOB_STATE_SUCCEEDED",
+            "JOB_STATE_FAILED",
+            "JOB_STATE_CANCELLED",
+            "JOB_STATE_EXPIRED",
+        }
+    )
+
     def detect_genres_batch(
         self, stations: List[StationInfo]
     ) -> dict[str, Optional[str]]:
         """
         Detect genres for multiple stations.
 
+        Prefers the Gemini batch endpoint, which amortizes one round-trip
+        across _BATCH_SIZE prompts instead of paying a request per
+        station; if batch submission fails (older SDK, unsupported
+        endpoint), falls back to per-station requests on a thread pool.
+
         Args:
             stations: List of StationInfo objects
 
         Returns:
             Dictionary mapping call_sign to detected genre
         """
-        results = {}
+        try:
+            return self._detect_genres_batch_api(stations)
+        except Exception as e:
+            log.warning(
+                "Batch API path failed (%s); falling back to per-request detection", e
+            )
+            return self._detect_genres_threaded(stations)
+
+    def _detect_genres_batch_api(
+        self, stations: List[StationInfo]
+    ) -> dict[str, Optional[str]]:
+        """Detect genres through the Gemini batch endpoint."""
+        results: dict[str, Optional[str]] = {}
+
+        # Serve cache hits up front; only misses go into batch jobs
+        pending = []
         for station in stations:
-            genre = self.detect_genre(station)
-            results[station.call_sign] = genre
+            cached = self._cache_get(self._cache_key(station))
+            if cached is not None:
+                results[station.call_sign] = cached
+            else:
+                results[station.call_sign] = None
+                pending.append(station)
+
+        config = types.GenerateContentConfig(
+            tools=[self.grounding_tool],
+            temperature=0.3,
+        )
+        for start in range(0, len(pending), self._BATCH_SIZE):
+            chunk = pending[start : start + self._BATCH_SIZE]
+            job = self.client.batches.create(
+                model="gemini-2.5-flash",
+                src=[
+                    {"contents": self._build_genre_query(s), "config": config}
+                    for s in chunk
+                ],
+            )
+            while job.state.name not in self._BATCH_TERMINAL_STATES:
+                time.sleep(self._BATCH_POLL_SECONDS)
+                job = self.client.batches.get(name=job.name)
+
+            if job.state.name != "JOB_STATE_SUCCEEDED":
+                log.warning("Batch job %s ended in %s", job.name, job.state.name)
+                continue
+
+            # Inlined responses come back in submission order
+            for station, item in zip(chunk, job.dest.inlined_responses):
+                response = getattr(item, "response", None)
+                if response is None or not self._has_grounding_metadata(response):
+                    continue
+                if response.text:
+                    genre = self._extract_genre(response.text)
+                    if genre:
+                        self._cache_put(self._cache_key(station), genre)
+                    results[station.call_sign] = genre
+
+        return results
+
+    def _detect_genres_threaded(
+        self, stations: List[StationInfo]
+    ) -> dict[str, Optional[str]]:
+        """Detect genres with one request per station on a bounded pool."""
+        # Each detection is an independent HTTP round-trip, so run them on
+        # a bounded pool; once any worker trips the quota flag the rest
+        # short-circuit without issuing more requests
+        results = {}
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = {
+                executor.submit(self.detect_genre, station): station.call_sign
+                for station in stations
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
         return results
 
     def _build_genre_query(self, station: StationInfo) -> str:
@@ -144,31 +335,14 @@ class GenreDetector:
         if not response_text:
             return None
 
-        # Clean up the response
-        genre = response_text.strip()
-
-        # Remove common prefixes/suffixes
-        prefixes_to_remove = [
-            "The genre is",
-            "The format is",
-            "This station plays",
-            "Primary genre:",
-            "Format:",
-            "Genre:",
-        ]
-
-        for prefix in prefixes_to_remove:
-            if genre.lower().startswith(prefix.lower()):
-                genre = genre[len(prefix) :].strip()
+        # Clean up the response and drop a leading boilerplate prefix
+        genre = _PREFIX_RE.sub("", response_text.strip(), count=1)
 
         # Remove quotes and extra punctuation
         genre = genre.strip(".\"'")
 
         # Normalize "Unknown" responses
-        if any(
-            word in genre.lower()
-            for word in ["unknown", "unclear", "cannot determine", "not found"]
-        ):
+        if _UNKNOWN_RE.search(genre):
             return "Unknown"
 
         # Limit length and capitalize properly
@@ -188,56 +362,33 @@ class GenreDetector:
             True if grounding metadata is present, False otherwise
         """
         try:
-            if not hasattr(response, "candidates") or not response.candidates:
+            candidates = getattr(response, "candidates", None)
+            if not candidates:
                 return False
 
-            candidate = response.candidates[0]
-
-            # Check for grounding_metadata attribute (snake_case)
-            if (
-                hasattr(candidate, "grounding_metadata")
-                and candidate.grounding_metadata
-            ):
-                metadata = candidate.grounding_metadata
+            candidate = candidates[0]
 
-                # Verify it has the essential grounding components
-                has_chunks = (
-                    hasattr(metadata, "grounding_chunks")
-                    and metadata.grounding_chunks
-                    and len(metadata.grounding_chunks) > 0
-                )
-
-                has_queries = (
-                    hasattr(metadata, "web_search_queries")
-                    and metadata.web_search_queries
-                    and len(metadata.web_search_queries) > 0
-                )
-
-                return has_chunks and has_queries
-
-            # Check for groundingMetadata attribute (camelCase) as fallback
-            if hasattr(candidate, "groundingMetadata") and candidate.groundingMetadata:
-                metadata = candidate.groundingMetadata
-
-                # Verify it has the essential grounding components
-                has_chunks = (
-                    hasattr(metadata, "groundingChunks")
-                    and metadata.groundingChunks
-                    and len(metadata.groundingChunks) > 0
-                )
-
-                has_queries = (
-                    hasattr(metadata, "webSearchQueries")
-                    and metadata.webSearchQueries
-                    and len(metadata.webSearchQueries) > 0
-                )
-
-                return has_chunks and has_queries
+            # snake_case with camelCase fallback, resolved once each
+            metadata = getattr(candidate, "grounding_metadata", None) or getattr(
+                candidate, "groundingMetadata", None
+            )
+            if metadata is None:
+                return False
 
-            return False
+            # Verify it has the essential grounding components; truthiness
+            # covers both None and empty without materializing len()
+            chunks = getattr(metadata, "grounding_chunks", None) or getattr(
+                metadata, "groundingChunks", None
+            )
+            if not chunks:
+                return False
+            queries = getattr(metadata, "web_search_queries", None) or getattr(
+                metadata, "webSearchQueries", None
+            )
+            return bool(queries)
 
         except Exception as e:
-            print(f"Error checking grounding metadata: {e}")
+            log.debug("Error checking grounding metadata: %s", e)
             return False
 
 
@@ -31,4 +31,17 @@ CREATE TABLE IF NOT EXISTS stations (
 -- Indexes for performance
 CREATE INDEX IF NOT EXISTS idx_stations_call_sign ON stations (call_sign);
 CREATE INDEX IF NOT EXISTS idx_stations_frequency ON stations (frequency);
-CREATE INDEX IF NOT EXISTS idx_stations_location ON stations (latitude, longitude);
\ No newline at end of file
+CREATE INDEX IF NOT EXISTS idx_stations_location ON stations (latitude, longitude);
+CREATE INDEX IF NOT EXISTS idx_stations_city ON stations (city);
+CREATE INDEX IF NOT EXISTS idx_stations_service_type ON stations (service_type);
+CREATE INDEX IF NOT EXISTS idx_stations_state ON stations (state);
+
+-- Partial index for the genre-detection selector query
+CREATE INDEX IF NOT EXISTS idx_stations_missing_genre ON stations (call_sign)
+    WHERE genre IS NULL OR genre = '';
+
+-- Covering index for the genre-detection selector: the leading genre
+-- column serves the missing-genre predicate and the remaining columns
+-- let the query answer from the index without touching the table b-tree
+CREATE INDEX IF NOT EXISTS idx_stations_genre_covering
+    ON stations (genre, call_sign, frequency, service_type, city, state);
\ No newline at end of file